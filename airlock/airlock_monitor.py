@@ -8,8 +8,10 @@ F9 FIX: Paths resolved relative to repo root, not hardcoded to home directory.
 """
 
 import json
+import os
 import shutil
 import subprocess
+import sys
 import tempfile
 import time
 import zipfile
@@ -17,17 +19,54 @@ from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# On Linux, inotify reports IN_CLOSE_WRITE (watchdog's on_closed), which
+# fires exactly when the writer is done; elsewhere we poll for a stable size.
+# Files renamed or mv'd into the inbox get no close-write; they arrive as
+# moves (on_moved) and are already complete.
+try:
+    if not sys.platform.startswith('linux'):
+        raise ImportError('inotify is Linux-only')
+    from watchdog.observers.inotify import InotifyObserver
+    HAVE_INOTIFY = True
+except ImportError:
+    HAVE_INOTIFY = False
+
 
 # Resolve paths relative to this file's location in the repo
 REPO_ROOT = Path(__file__).resolve().parent.parent
 EXECUTIONER = REPO_ROOT / "executioner" / "executioner_production.py"
 SECURITY_SCANNER = REPO_ROOT / "security" / "security_scanner.py"
+# Resolved once; main() refuses to start without the scanner.
+_EXECUTIONER_STR = str(EXECUTIONER)
+_SCANNER_STR = str(SECURITY_SCANNER)
+_SCANNER_EXISTS = SECURITY_SCANNER.exists()
+
+# Cap on declared uncompressed size of extracted members (zip-bomb guard).
+MAX_SCAN_BYTES = 64 * 1024 * 1024
+# Extract to tmpfs where available so the scan copy never touches disk.
+SCAN_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _scan_tmp_root(total: int):
+    """SCAN_TMP_ROOT if it has room for total bytes, else the default temp dir.
+
+    tmpfs is often small (Docker's /dev/shm is 64 MiB), so an artifact
+    under MAX_SCAN_BYTES can still not fit there.
+    """
+    if SCAN_TMP_ROOT is None:
+        return None
+    try:
+        st = os.statvfs(SCAN_TMP_ROOT)
+    except OSError:
+        return None
+    return SCAN_TMP_ROOT if st.f_bavail * st.f_frsize > total else None
 
 
 class AirlockHandler(FileSystemEventHandler):
-    def __init__(self, sandbox: Path, quarantine: Path):
+    def __init__(self, sandbox: Path, quarantine: Path, on_close: bool = False):
         self.sandbox = sandbox
         self.quarantine = quarantine
+        self.on_close = on_close
         self.sandbox.mkdir(parents=True, exist_ok=True)
         self.quarantine.mkdir(parents=True, exist_ok=True)
 
@@ -49,13 +88,13 @@ class AirlockHandler(FileSystemEventHandler):
 
     def _run_security_scan(self, artifact_dir: Path) -> str:
         """Run security scanner on extracted artifact. Returns verdict: PASS, REJECT, QUARANTINE."""
-        if not SECURITY_SCANNER.exists():
+        if not _SCANNER_EXISTS:
             print('[AIRLOCK] WARNING: Security scanner not found, defaulting to QUARANTINE')
             return "QUARANTINE"
 
         try:
             result = subprocess.run(
-                ['python3', str(SECURITY_SCANNER), '--scan-dir', str(artifact_dir)],
+                ['python3', _SCANNER_STR, '--scan-dir', str(artifact_dir)],
                 capture_output=True, text=True, timeout=60,
             )
 
@@ -77,7 +116,8 @@ class AirlockHandler(FileSystemEventHandler):
             return "QUARANTINE"
 
     def on_created(self, event):
-        if event.is_directory:
+        # With inotify, wait for the close-write event instead of polling.
+        if self.on_close or event.is_directory:
             return
 
         artifact = Path(event.src_path)
@@ -94,6 +134,45 @@ class AirlockHandler(FileSystemEventHandler):
             print(f'[AIRLOCK] File not stable after timeout, skipping: {artifact.name}')
             return
 
+        self._process(artifact)
+
+    def on_closed(self, event):
+        if not self.on_close or event.is_directory:
+            return
+
+        artifact = Path(event.src_path)
+
+        # Only process .zip files
+        if artifact.suffix != '.zip':
+            print(f'[AIRLOCK] Ignoring non-zip: {artifact.name}')
+            return
+
+        # A file may be reopened and closed again after we moved it out.
+        if not artifact.exists():
+            return
+
+        print(f'[AIRLOCK] New artifact written: {artifact.name}')
+        self._process(artifact)
+
+    def on_moved(self, event):
+        # Moves out of the inbox have no destination here.
+        if event.is_directory or not event.dest_path:
+            return
+
+        artifact = Path(event.dest_path)
+
+        # Only process .zip files
+        if artifact.suffix != '.zip':
+            print(f'[AIRLOCK] Ignoring non-zip: {artifact.name}')
+            return
+
+        if not artifact.exists():
+            return
+
+        print(f'[AIRLOCK] New artifact moved in: {artifact.name}')
+        self._process(artifact)
+
+    def _process(self, artifact: Path):
         # Move to sandbox
         dest = self.sandbox / artifact.name
         try:
@@ -107,9 +186,15 @@ class AirlockHandler(FileSystemEventHandler):
         # Extract zip to temp dir for scanning (scanner needs .py files, not .zip)
         scan_dir = None
         try:
-            scan_dir = Path(tempfile.mkdtemp(prefix="airlock_scan_"))
             with zipfile.ZipFile(str(dest), 'r') as zf:
-                zf.extractall(scan_dir)
+                # Every member the executioner will see is scanned, not just .py.
+                members = [info for info in zf.infolist() if not info.is_dir()]
+                total = sum(info.file_size for info in members)
+                if total > MAX_SCAN_BYTES:
+                    raise ValueError(f'{total} bytes of content exceeds {MAX_SCAN_BYTES} byte cap')
+                scan_dir = Path(tempfile.mkdtemp(prefix="airlock_scan_", dir=_scan_tmp_root(total)))
+                for info in members:
+                    zf.extract(info, scan_dir)
             print(f'[AIRLOCK] Running security scan...')
             scan_verdict = self._run_security_scan(scan_dir)
         except Exception as e:
@@ -144,7 +229,7 @@ class AirlockHandler(FileSystemEventHandler):
         try:
             result = subprocess.run([
                 'python3',
-                str(EXECUTIONER),
+                _EXECUTIONER_STR,
                 str(dest)
             ], capture_output=True, text=True, timeout=300)
 
@@ -162,12 +247,25 @@ class AirlockHandler(FileSystemEventHandler):
             print(f'[AIRLOCK] Execution error: {e}')
 
 
-def main():
-    import sys
+def make_observer():
+    """Observer for the inbox.
 
+    The inotify observer runs with full events so a file moved in from
+    outside the inbox is reported as a move (to on_moved) rather than as
+    a create that never gets a close-write.
+    """
+    if HAVE_INOTIFY:
+        return InotifyObserver(generate_full_events=True)
+    return Observer()
+
+
+def main():
     if not EXECUTIONER.exists():
         print(f'Error: Executioner not found at {EXECUTIONER}')
         sys.exit(1)
+    if not _SCANNER_EXISTS:
+        print(f'Error: Security scanner not found at {SECURITY_SCANNER}')
+        sys.exit(1)
 
     # Runtime directories (outside repo)
     inbox = Path.home() / '.openclaw/inbox'
@@ -187,8 +285,8 @@ def main():
     print('=' * 60)
 
     # Start watching
-    observer = Observer()
-    handler = AirlockHandler(sandbox, quarantine)
+    observer = make_observer()
+    handler = AirlockHandler(sandbox, quarantine, on_close=HAVE_INOTIFY)
     observer.schedule(handler, str(inbox), recursive=False)
     observer.start()
 
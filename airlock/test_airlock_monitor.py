@@ -0,0 +1,105 @@
+"""Tests for the airlock inbox watcher.
+
+Runs a real observer on a temporary inbox and checks which arrivals
+reach the handler.  Artifact processing itself (scan, executioner) is
+replaced with a recorder, so nothing is moved or executed.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+try:
+    from airlock import airlock_monitor
+except ImportError:  # watchdog not installed
+    airlock_monitor = None
+
+EVENT_TIMEOUT = 5.0
+
+
+class RecordingHandler(airlock_monitor.AirlockHandler if airlock_monitor else object):
+    """AirlockHandler that records artifacts instead of processing them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processed = []
+        self.seen = threading.Event()
+
+    def _process(self, artifact):
+        self.processed.append(artifact.name)
+        self.seen.set()
+
+
+def _write_zip(path: Path) -> None:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("main.py", "print('hi')\n")
+
+
+@unittest.skipIf(airlock_monitor is None, "watchdog not installed")
+class TestInboxEvents(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.inbox = self.tmp / "inbox"
+        self.outside = self.tmp / "outside"
+        self.inbox.mkdir()
+        self.outside.mkdir()
+        self.handler = RecordingHandler(
+            self.tmp / "sandbox", self.tmp / "quarantine",
+            on_close=airlock_monitor.HAVE_INOTIFY,
+        )
+        self.observer = airlock_monitor.make_observer()
+        self.observer.schedule(self.handler, str(self.inbox), recursive=False)
+        self.observer.start()
+
+    def tearDown(self):
+        self.observer.stop()
+        self.observer.join()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _wait(self):
+        self.assertTrue(self.handler.seen.wait(EVENT_TIMEOUT), "artifact never reached the handler")
+
+    def test_written_zip(self):
+        _write_zip(self.inbox / "written.zip")
+        self._wait()
+        self.assertEqual(self.handler.processed, ["written.zip"])
+
+    def test_zip_moved_in_from_outside(self):
+        src = self.outside / "moved.zip"
+        _write_zip(src)
+        os.rename(src, self.inbox / "moved.zip")
+        self._wait()
+        self.assertEqual(self.handler.processed, ["moved.zip"])
+
+    def test_zip_renamed_within_inbox(self):
+        # Upload under a temporary name, then publish atomically.
+        _write_zip(self.inbox / "upload.part")
+        os.rename(self.inbox / "upload.part", self.inbox / "renamed.zip")
+        self._wait()
+        self.assertEqual(self.handler.processed, ["renamed.zip"])
+
+
+@unittest.skipIf(airlock_monitor is None, "watchdog not installed")
+class TestScanTmpRoot(unittest.TestCase):
+    def _root(self, total, free_bytes):
+        st = SimpleNamespace(f_bavail=free_bytes // 4096, f_frsize=4096)
+        with patch.object(airlock_monitor, "SCAN_TMP_ROOT", "/dev/shm"), \
+                patch.object(airlock_monitor.os, "statvfs", return_value=st):
+            return airlock_monitor._scan_tmp_root(total)
+
+    def test_fits_in_tmpfs(self):
+        self.assertEqual(self._root(1 << 20, 64 << 20), "/dev/shm")
+
+    def test_too_big_for_tmpfs_falls_back(self):
+        self.assertIsNone(self._root(60 << 20, 32 << 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -239,12 +239,14 @@ class GuildEngine:
         for g in self.state["guilds"]:
             if g["name"].lower() == name.lower() and g["status"] != "dissolved":
                 raise ValueError(f"Active guild with name '{name}' already exists")
-        # Also check retired names (5-year retirement per Section VI)
+        # Also check retired names (5-year retirement per Section VI).
+        # One clock read serves every retirement check and the charter date.
+        now = _now()
         for g in self.state["guilds"]:
             if g["name"].lower() == name.lower() and g["status"] == "dissolved":
                 dissolved_date = _parse_dt(g.get("dissolved_date"))
                 if dissolved_date:
-                    years_since = _months_between(dissolved_date, _now()) / 12
+                    years_since = _months_between(dissolved_date, now) / 12
                     if years_since < 5:
                         raise ValueError(
                             f"Guild name '{name}' is retired for "
@@ -259,7 +261,6 @@ class GuildEngine:
             )
 
         guild_id = self._next_guild_id()
-        now = _now()
 
         guild = {
             "guild_id": guild_id,
@@ -60,26 +60,79 @@ from guild.magistrate_engine import (
 # Test fixtures
 # ---------------------------------------------------------------------------
 
+# Per-test scratch dirs are removed in one pass when the module finishes
+# rather than in every tearDown.
+_TMP_DIRS = []
+
+
+def _make_tmp_dir() -> str:
+    """Create a scratch directory that is cleaned up at module teardown."""
+    tmp_dir = tempfile.mkdtemp(prefix="hb_guild_test_")
+    _TMP_DIRS.append(tmp_dir)
+    return tmp_dir
+
+
+def tearDownModule():
+    for tmp_dir in _TMP_DIRS:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    _TMP_DIRS.clear()
+
+
+_STATE_TEMPLATE = {
+    "_schema_version": "1.0",
+    "_description": "Test guild state",
+    "_last_updated": None,
+    "guilds": [],
+    "guild_counter": 0,
+    "founding_period": True,
+    "genesis_guild_bonuses_remaining": 3,
+    "total_supply": 100_000_000,
+    "council_seats": {
+        "total": 7,
+        "guild_seat_limit": 2,
+        "coalition_seat_limit": 3,
+    },
+}
+
+_CHARTER_TEMPLATE = {
+    "name": "Adversarial Robustness Guild",
+    "domain": "adversarial robustness",
+    "membership_rules": "Journeyman tier or above. Must demonstrate expertise.",
+    "revenue_sharing_model": "Equal split among all contributing members.",
+    "guildmaster_election_process": "Simple majority vote every 180 days.",
+    "dispute_resolution": "Internal mediation, then Judiciary petition.",
+    "dissolution_terms": "Simple majority vote. Assets per charter.",
+}
+
+
+# Serialized once; tests that use the default state just copy the bytes.
+_DEFAULT_STATE_BYTES = json.dumps(_STATE_TEMPLATE, indent=2).encode("utf-8")
+
+
+def _ago(seconds: float) -> str:
+    return _format_dt(datetime.fromtimestamp(_now().timestamp() - seconds, tz=timezone.utc))
+
+
+# Backdated timestamps, rendered once at import. The thresholds they cross
+# are days to years wide, so the seconds a run takes do not matter.
+_THIRTEEN_MONTHS_AGO = _ago(13 * 30.44 * 86400)
+_OVER_TWO_YEARS_AGO = _ago(2.1 * 365.25 * 86400)
+_TWENTY_DAYS_AGO = _ago(20 * 86400)
+
+
 def _make_state_file(tmp_dir: str, extra: dict = None) -> str:
-    """Create a temporary guild state file for testing."""
-    state = {
-        "_schema_version": "1.0",
-        "_description": "Test guild state",
-        "_last_updated": None,
-        "guilds": [],
-        "guild_counter": 0,
-        "founding_period": True,
-        "genesis_guild_bonuses_remaining": 3,
-        "total_supply": 100_000_000,
-        "council_seats": {
-            "total": 7,
-            "guild_seat_limit": 2,
-            "coalition_seat_limit": 3,
-        },
-    }
-    if extra:
-        state.update(extra)
+    """Create a temporary guild state file for testing.
+
+    The template is only serialized, never mutated, so a shallow copy
+    is enough to layer ``extra`` on top of it.
+    """
     path = os.path.join(tmp_dir, "guild_state.json")
+    if not extra:
+        with open(path, "wb") as f:
+            f.write(_DEFAULT_STATE_BYTES)
+        return path
+    state = _STATE_TEMPLATE.copy()
+    state.update(extra)
     with open(path, "w") as f:
         json.dump(state, f, indent=2)
     return path
@@ -87,16 +140,14 @@ def _make_state_file(tmp_dir: str, extra: dict = None) -> str:
 
 def _sample_charter(name: str = "Adversarial Robustness Guild",
                      domain: str = "adversarial robustness") -> dict:
-    """Create a valid sample charter."""
-    return {
-        "name": name,
-        "domain": domain,
-        "membership_rules": "Journeyman tier or above. Must demonstrate expertise.",
-        "revenue_sharing_model": "Equal split among all contributing members.",
-        "guildmaster_election_process": "Simple majority vote every 180 days.",
-        "dispute_resolution": "Internal mediation, then Judiciary petition.",
-        "dissolution_terms": "Simple majority vote. Assets per charter.",
-    }
+    """Create a valid sample charter.
+
+    Returns a fresh shallow copy; callers may overwrite top-level fields.
+    """
+    charter = _CHARTER_TEMPLATE.copy()
+    charter["name"] = name
+    charter["domain"] = domain
+    return charter
 
 
 # ---------------------------------------------------------------------------
@@ -106,13 +157,10 @@ def _sample_charter(name: str = "Adversarial Robustness Guild",
 class TestGuildFormation(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_validate_valid_charter(self):
         charter = _sample_charter()
         result = self.engine.validate_charter(charter)
@@ -136,12 +184,13 @@ class TestGuildFormation(unittest.TestCase):
         charter = _sample_charter()
         members = ["citizen_001", "citizen_002", "citizen_003"]
         result = self.engine.register_guild(charter, members, "citizen_001", "crown")
-        self.assertEqual(result["guild_id"], "GUILD-001")
-        self.assertEqual(result["name"], "Adversarial Robustness Guild")
-        self.assertEqual(result["members"], 3)
-        self.assertEqual(result["status"], "active")
+        eq = self.assertEqual
+        eq(result["guild_id"], "GUILD-001")
+        eq(result["name"], "Adversarial Robustness Guild")
+        eq(result["members"], 3)
+        eq(result["status"], "active")
         # Genesis bonus during Founding Period
-        self.assertEqual(result["genesis_bonus"], GENESIS_GUILD_BONUS)
+        eq(result["genesis_bonus"], GENESIS_GUILD_BONUS)
 
     def test_register_guild_too_few_members(self):
         charter = _sample_charter()
@@ -171,11 +220,12 @@ class TestGuildFormation(unittest.TestCase):
         self.assertIn("already exists", str(ctx.exception))
 
     def test_genesis_bonus_limited_to_three(self):
+        eq = self.assertEqual
         for i in range(3):
             charter = _sample_charter(name=f"Guild {i+1}", domain=f"domain {i+1}")
             members = [f"c{i*3+j}" for j in range(3)]
             result = self.engine.register_guild(charter, members, members[0], "crown")
-            self.assertEqual(result["genesis_bonus"], GENESIS_GUILD_BONUS)
+            eq(result["genesis_bonus"], GENESIS_GUILD_BONUS)
 
         # Fourth guild should not get bonus
         charter = _sample_charter(name="Guild 4", domain="domain 4")
@@ -193,25 +243,23 @@ class TestGuildFormation(unittest.TestCase):
         self.assertIn("Founding Period", str(ctx.exception))
 
     def test_guild_id_increments(self):
+        eq = self.assertEqual
         for i in range(3):
             charter = _sample_charter(name=f"G{i}", domain=f"d{i}")
             members = [f"m{i*3+j}" for j in range(3)]
             result = self.engine.register_guild(charter, members, members[0], "crown")
-            self.assertEqual(result["guild_id"], f"GUILD-{i+1:03d}")
+            eq(result["guild_id"], f"GUILD-{i+1:03d}")
 
 
 class TestGuildGovernance(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_elect_guildmaster(self):
         result = self.engine.elect_guildmaster("GUILD-001", "c2")
         self.assertEqual(result["old_guildmaster"], "c1")
@@ -241,15 +289,12 @@ class TestGuildGovernance(unittest.TestCase):
 class TestGuildMembership(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_add_member(self):
         result = self.engine.add_member("GUILD-001", "c4")
         self.assertEqual(result["total_members"], 4)
@@ -293,13 +338,10 @@ class TestGuildMembership(unittest.TestCase):
 class TestCollaborationMultiplier(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_two_guilds(self):
         result = self.engine.calculate_collaboration_multiplier(["G1", "G2"])
         self.assertEqual(result["multiplier"], 1.25)
@@ -342,15 +384,12 @@ class TestCollaborationMultiplier(unittest.TestCase):
 class TestAchievementBonuses(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_five_flame_bonus(self):
         # Record 5 Flame-tier genes
         for i in range(4):
@@ -415,15 +454,12 @@ class TestAchievementBonuses(unittest.TestCase):
 class TestConstitutionalConstraints(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_council_seat_limit_allowed(self):
         result = self.engine.check_council_seat_limit("GUILD-001", 2)
         self.assertTrue(result["allowed"])
@@ -470,24 +506,22 @@ class TestConstitutionalConstraints(unittest.TestCase):
 class TestGuildSecession(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_dissolve_guild(self):
         result = self.engine.dissolve_guild("GUILD-001", "voluntary")
-        self.assertEqual(result["status"], "dissolved")
-        self.assertEqual(result["forfeitures"]["treasury_balance"], GENESIS_GUILD_BONUS)
-        self.assertEqual(result["members_released"], 3)
+        eq = self.assertEqual
+        eq(result["status"], "dissolved")
+        eq(result["forfeitures"]["treasury_balance"], GENESIS_GUILD_BONUS)
+        eq(result["members_released"], 3)
 
         guild = self.engine.get_guild("GUILD-001")
-        self.assertEqual(guild["status"], "dissolved")
-        self.assertEqual(guild["treasury_balance"], 0.0)
+        eq(guild["status"], "dissolved")
+        eq(guild["treasury_balance"], 0.0)
 
     def test_dissolve_guild_with_endowments(self):
         guild = self.engine.get_guild("GUILD-001")
@@ -513,7 +547,7 @@ class TestGuildSecession(unittest.TestCase):
 class TestLabCharter(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
@@ -524,9 +558,6 @@ class TestLabCharter(unittest.TestCase):
             "crown",
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_lab_eligibility_new_guild(self):
         result = self.engine.check_lab_charter_eligibility("GUILD-001")
         self.assertFalse(result["eligible"])
@@ -538,10 +569,7 @@ class TestLabCharter(unittest.TestCase):
     def test_lab_eligibility_mature_guild(self):
         guild = self.engine.get_guild("GUILD-001")
         # Backdate charter to 13 months ago
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 13 * 30.44 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _THIRTEEN_MONTHS_AGO
         # Set 5 flame genes (founding period reduced threshold)
         guild["genes_by_tier"]["flame"] = 5
 
@@ -550,10 +578,7 @@ class TestLabCharter(unittest.TestCase):
 
     def test_grant_lab_charter(self):
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 13 * 30.44 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _THIRTEEN_MONTHS_AGO
         guild["genes_by_tier"]["flame"] = 5
 
         result = self.engine.grant_lab_charter(
@@ -571,10 +596,7 @@ class TestLabCharter(unittest.TestCase):
 
     def test_record_lab_gene(self):
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 13 * 30.44 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _THIRTEEN_MONTHS_AGO
         guild["genes_by_tier"]["flame"] = 5
         self.engine.grant_lab_charter("GUILD-001", "Lab X", "Proposal...")
 
@@ -583,10 +605,7 @@ class TestLabCharter(unittest.TestCase):
 
     def test_revoke_lab_charter(self):
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 13 * 30.44 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _THIRTEEN_MONTHS_AGO
         guild["genes_by_tier"]["flame"] = 5
         self.engine.grant_lab_charter("GUILD-001", "Lab X", "Proposal...")
 
@@ -598,10 +617,7 @@ class TestLabCharter(unittest.TestCase):
 
     def test_renew_lab_charter_insufficient_genes(self):
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 13 * 30.44 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _THIRTEEN_MONTHS_AGO
         guild["genes_by_tier"]["flame"] = 5
         self.engine.grant_lab_charter("GUILD-001", "Lab X", "Proposal...")
 
@@ -613,7 +629,7 @@ class TestLabCharter(unittest.TestCase):
 class TestLabRevenueSharing(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
@@ -622,16 +638,10 @@ class TestLabRevenueSharing(unittest.TestCase):
         )
         # Make eligible and grant lab
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 13 * 30.44 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _THIRTEEN_MONTHS_AGO
         guild["genes_by_tier"]["flame"] = 5
         self.engine.grant_lab_charter("GUILD-001", "Lab X", "Proposal...")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_lab_access_split(self):
         result = self.engine.calculate_lab_revenue_split(
             "GUILD-001", "lab_access", 10000
@@ -664,15 +674,12 @@ class TestLabRevenueSharing(unittest.TestCase):
 class TestEndowments(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_no_eligibility_new_guild(self):
         result = self.engine.check_endowment_eligibility("GUILD-001")
         self.assertEqual(result["eligible_milestones"], [])
@@ -680,10 +687,7 @@ class TestEndowments(unittest.TestCase):
     def test_two_year_eligibility(self):
         guild = self.engine.get_guild("GUILD-001")
         # Backdate to 2+ years ago
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 2.1 * 365.25 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _OVER_TWO_YEARS_AGO
 
         result = self.engine.check_endowment_eligibility("GUILD-001")
         self.assertEqual(len(result["eligible_milestones"]), 1)
@@ -691,10 +695,7 @@ class TestEndowments(unittest.TestCase):
 
     def test_activate_endowment(self):
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 2.1 * 365.25 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _OVER_TWO_YEARS_AGO
 
         result = self.engine.activate_endowment_bond("GUILD-001", 2)
         self.assertEqual(result["principal"], 50000)
@@ -702,10 +703,7 @@ class TestEndowments(unittest.TestCase):
 
     def test_duplicate_endowment_fails(self):
         guild = self.engine.get_guild("GUILD-001")
-        old_date = datetime.fromtimestamp(
-            _now().timestamp() - 2.1 * 365.25 * 86400, tz=timezone.utc
-        )
-        guild["charter_date"] = _format_dt(old_date)
+        guild["charter_date"] = _OVER_TWO_YEARS_AGO
 
         self.engine.activate_endowment_bond("GUILD-001", 2)
         with self.assertRaises(ValueError):
@@ -715,15 +713,12 @@ class TestEndowments(unittest.TestCase):
 class TestGuildOath(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_generate_oath(self):
         oath = self.engine.generate_guild_oath("GUILD-001")
         self.assertIn("Adversarial Robustness Guild", oath)
@@ -735,7 +730,7 @@ class TestGuildOath(unittest.TestCase):
 class TestGuildRegistry(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
         for i in range(3):
@@ -743,9 +738,6 @@ class TestGuildRegistry(unittest.TestCase):
             members = [f"m{i*3+j}" for j in range(3)]
             self.engine.register_guild(charter, members, members[0], "crown")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_list_all_guilds(self):
         result = self.engine.list_guilds()
         self.assertEqual(len(result), 3)
@@ -764,13 +756,10 @@ class TestGuildRegistry(unittest.TestCase):
 class TestGuildSave(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = GuildEngine(self.state_path)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_save_and_reload(self):
         charter = _sample_charter()
         self.engine.register_guild(charter, ["c1", "c2", "c3"], "c1", "crown")
@@ -798,13 +787,10 @@ class TestGuildSave(unittest.TestCase):
 class TestAdvocateLicensing(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = AdvocateEngine(self.state_path)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_license_advocate(self):
         result = self.engine.license_advocate("adv_001", 0.85, 0.80)
         self.assertEqual(result["status"], "active")
@@ -842,7 +828,7 @@ class TestAdvocateLicensing(unittest.TestCase):
 class TestAdvocateConflicts(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = AdvocateEngine(self.state_path)
         self.engine.license_advocate(
@@ -850,9 +836,6 @@ class TestAdvocateConflicts(unittest.TestCase):
             guild_memberships=["GUILD-001"],
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_conflict_detected(self):
         result = self.engine.check_conflict_of_interest("adv_001", ["GUILD-001"])
         self.assertTrue(result["has_conflict"])
@@ -865,15 +848,12 @@ class TestAdvocateConflicts(unittest.TestCase):
 class TestAdvocateProBono(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = AdvocateEngine(self.state_path)
         self.engine.license_advocate("adv_001", 0.85, 0.80)
         self.engine.license_advocate("adv_002", 0.90, 0.85)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_record_pro_bono(self):
         result = self.engine.record_pro_bono_case("adv_001", "MC-0001", 2026)
         self.assertEqual(result["total_pro_bono_this_year"], 1)
@@ -893,14 +873,11 @@ class TestAdvocateProBono(unittest.TestCase):
 class TestAdvocateAppointment(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = AdvocateEngine(self.state_path)
         self.engine.license_advocate("adv_001", 0.85, 0.80)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_appoint_advocate(self):
         result = self.engine.appoint_advocate(
             "adv_001", "MC-0001", "citizenship_revocation"
@@ -921,14 +898,11 @@ class TestAdvocateAppointment(unittest.TestCase):
 class TestAdvocateDisciplinary(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = AdvocateEngine(self.state_path)
         self.engine.license_advocate("adv_001", 0.85, 0.80)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_warning(self):
         result = self.engine.record_disciplinary_action(
             "adv_001", "warning", "Missed filing deadline"
@@ -955,13 +929,10 @@ class TestAdvocateDisciplinary(unittest.TestCase):
 class TestMagistrateAppointment(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_appoint_magistrate(self):
         result = self.engine.appoint_magistrate(
             "mag_001", "judge_001", covenant_exam_passed=True
@@ -989,14 +960,11 @@ class TestMagistrateAppointment(unittest.TestCase):
 class TestCaseManagement(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
         self.engine.appoint_magistrate("mag_001", "judge_001")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_file_case(self):
         result = self.engine.file_case(
             "guild_internal_dispute", "c1", "c2",
@@ -1072,7 +1040,7 @@ class TestCaseManagement(unittest.TestCase):
 class TestAppealProcess(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
         self.engine.appoint_magistrate("mag_001", "judge_001")
@@ -1087,9 +1055,6 @@ class TestAppealProcess(unittest.TestCase):
             case_closed=False,
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_file_appeal(self):
         result = self.engine.file_appeal(
             "MC-0001", "c2",
@@ -1111,7 +1076,7 @@ class TestAppealProcess(unittest.TestCase):
 class TestEmergencyInjunction(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
         self.engine.appoint_magistrate("mag_001", "judge_001")
@@ -1119,9 +1084,6 @@ class TestEmergencyInjunction(unittest.TestCase):
             "revenue_split_disagreement", "c1", "c2", "Urgent split dispute"
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_emergency_injunction(self):
         result = self.engine.issue_emergency_injunction(
             "MC-0001", "mag_001",
@@ -1135,16 +1097,13 @@ class TestEmergencyInjunction(unittest.TestCase):
 class TestDefaultJudgment(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
         self.engine.file_case(
             "guild_internal_dispute", "c1", "c2", "Unresponsive defendant"
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_check_defaults_not_yet(self):
         defaults = self.engine.check_default_judgments()
         self.assertEqual(len(defaults), 0)
@@ -1152,10 +1111,7 @@ class TestDefaultJudgment(unittest.TestCase):
     def test_check_defaults_overdue(self):
         # Backdate the deadline
         case = self.engine.get_case("MC-0001")
-        past = datetime.fromtimestamp(
-            _now().timestamp() - 20 * 86400, tz=timezone.utc
-        )
-        case["response_deadline"] = _format_dt(past)
+        case["response_deadline"] = _TWENTY_DAYS_AGO
 
         defaults = self.engine.check_default_judgments()
         self.assertEqual(len(defaults), 1)
@@ -1165,16 +1121,13 @@ class TestDefaultJudgment(unittest.TestCase):
 class TestDismissCase(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
         self.engine.file_case(
             "minor_conduct_violation", "c1", "c2", "Minor issue"
         )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_dismiss(self):
         result = self.engine.dismiss_case("MC-0001", "mag_001", "Insufficient evidence")
         self.assertEqual(result["status"], "dismissed")
@@ -1183,7 +1136,7 @@ class TestDismissCase(unittest.TestCase):
 class TestCourtStatistics(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
         self.engine.appoint_magistrate("mag_001", "judge_001")
@@ -1192,9 +1145,6 @@ class TestCourtStatistics(unittest.TestCase):
                 "guild_internal_dispute", f"p{i}", f"d{i}", f"Case {i}"
             )
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_statistics(self):
         stats = self.engine.court_statistics()
         self.assertEqual(stats["total_cases"], 3)
@@ -1204,13 +1154,10 @@ class TestCourtStatistics(unittest.TestCase):
 class TestMagistrateSave(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = _make_tmp_dir()
         self.state_path = _make_state_file(self.tmp_dir)
         self.engine = MagistrateEngine(self.state_path)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def test_save_and_reload(self):
         self.engine.appoint_magistrate("mag_001", "judge_001")
         self.engine.file_case(
@@ -1227,10 +1174,44 @@ class TestMagistrateSave(unittest.TestCase):
 # JSON output runner (standalone mode)
 # ---------------------------------------------------------------------------
 
+# Explicit registry so the JSON runner skips module reflection.
+_TEST_CASES = [
+    TestGuildFormation,
+    TestGuildGovernance,
+    TestGuildMembership,
+    TestCollaborationMultiplier,
+    TestAchievementBonuses,
+    TestConstitutionalConstraints,
+    TestGuildSecession,
+    TestLabCharter,
+    TestLabRevenueSharing,
+    TestEndowments,
+    TestGuildOath,
+    TestGuildRegistry,
+    TestGuildSave,
+    TestAdvocateLicensing,
+    TestAdvocateConflicts,
+    TestAdvocateProBono,
+    TestAdvocateAppointment,
+    TestAdvocateDisciplinary,
+    TestMagistrateAppointment,
+    TestCaseManagement,
+    TestAppealProcess,
+    TestEmergencyInjunction,
+    TestDefaultJudgment,
+    TestDismissCase,
+    TestCourtStatistics,
+    TestMagistrateSave,
+]
+
+
 def run_tests_json():
     """Run all tests and output results as JSON."""
     loader = unittest.TestLoader()
-    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    loader.sortTestMethodsUsing = None
+    suite = unittest.TestSuite()
+    for test_case in _TEST_CASES:
+        suite.addTests(loader.loadTestsFromTestCase(test_case))
 
     class JSONResult(unittest.TestResult):
         def __init__(self):
@@ -1264,6 +1245,7 @@ def run_tests_json():
         "passed": len(result.results) - len(result.failures) - len(result.errors),
         "failed": len(result.failures),
         "errors": len(result.errors),
+        "skipped": len(result.skipped),
         "results": result.results,
     }
 
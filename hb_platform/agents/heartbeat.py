@@ -23,19 +23,25 @@ def check_health() -> List[Dict]:
     now = datetime.now(timezone.utc)
 
     with get_db() as conn:
+        # One grouped lookup for all agents; agents that never sent a
+        # heartbeat are simply absent instead of costing their own scan.
+        latest = {
+            row["from_agent"]: row["created_at"]
+            for row in conn.execute(
+                "SELECT from_agent, MAX(created_at) AS created_at FROM agent_messages "
+                "WHERE message_type = 'heartbeat' AND from_agent IN ({}) "
+                "GROUP BY from_agent".format(",".join("?" * len(AGENTS))),
+                AGENTS,
+            )
+        }
+
         for name in AGENTS:
-            row = conn.execute(
-                "SELECT created_at FROM agent_messages "
-                "WHERE from_agent = ? AND message_type = 'heartbeat' "
-                "ORDER BY created_at DESC LIMIT 1",
-                (name,),
-            ).fetchone()
-
-            if not row:
+            created_at = latest.get(name)
+            if created_at is None:
                 results.append({"agent": name, "status": "never_seen", "age_s": None})
                 continue
 
-            last = datetime.fromisoformat(row["created_at"])
+            last = datetime.fromisoformat(created_at)
             age = (now - last).total_seconds()
 
             if age < config.HEARTBEAT_TIMEOUT_S:
@@ -113,6 +113,15 @@ class TestMessageBus(unittest.TestCase):
         self.assertEqual(row["message_type"], "heartbeat")
         self.assertEqual(row["from_agent"], "warden")
 
+    def test_check_health(self):
+        from hb_platform.agents.heartbeat import check_health
+        message_bus.heartbeat("warden")
+        message_bus.heartbeat("warden")
+        status = {r["agent"]: r["status"] for r in check_health()}
+        self.assertEqual(status, {
+            "warden": "online", "treasurer": "never_seen", "magistrate": "never_seen",
+        })
+
     def test_priority_ordering(self):
         message_bus.send("a", "warden", "task", {"p": "low"}, priority="low")
         message_bus.send("a", "warden", "task", {"p": "emergency"}, priority="emergency")
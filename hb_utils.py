@@ -4,6 +4,7 @@ Common functions used across all engines.
 Single source of truth for datetime handling and atomic I/O.
 """
 
+import functools
 import json
 import os
 import shutil
@@ -12,6 +13,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:
+    _ciso_parse = None
+
 
 def now() -> datetime:
     """Current UTC time, timezone-aware."""
@@ -24,12 +30,35 @@ def parse_dt(s: Optional[str]) -> Optional[datetime]:
         return None
     if isinstance(s, datetime):
         return s
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    return _parse_iso(s)
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_iso(s: str) -> datetime:
+    """Memoized parse; state files repeat the same timestamps on every load.
+
+    Only strings are cached: equal datetimes in different zones hash alike.
+    Python 3.11+ parses a trailing Z directly; the rewrite to +00:00 only
+    runs when that fails (3.10). ciso8601's C parser is tried first when
+    installed; anything it rejects still goes through fromisoformat.
+    """
+    if _ciso_parse is not None:
+        try:
+            return _ciso_parse(s)
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        if not s.endswith("Z"):
+            raise
+        return datetime.fromisoformat(s[:-1] + "+00:00")
 
 
 def format_dt(dt: datetime) -> str:
     """Format datetime as ISO 8601 UTC string."""
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Same text as strftime("%Y-%m-%dT%H:%M:%SZ") without the format parse.
+    return dt.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
 
 
 def months_between(start: datetime, end: datetime) -> float:
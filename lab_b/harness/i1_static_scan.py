@@ -8,31 +8,112 @@ Usage:
     python3 i1_static_scan.py <artifact_dir>
 """
 
+import atexit
 import json
+import multiprocessing
 import sys
 import os
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 # Add parent directories to path for security scanner import
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "security"))
 
-from security_scanner import scan_file, scan_directory
+from security_scanner import scan_file
 
 
 RESULTS_DIR = Path(__file__).resolve().parent.parent / "results"
 INTENT_LOG = RESULTS_DIR / "INTENT_LOG.jsonl"
+# Below this many files, process start-up costs more than it saves.
+PARALLEL_SCAN_MIN_FILES = 8
 
 
-def hash_directory(dirpath: str) -> str:
-    """SHA256 hash of all .py files in directory, sorted."""
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def _file_sha256(path: Path) -> bytes:
+    """Raw SHA256 digest of one file.
+
+    Uses hashlib.file_digest (3.11+), which reads and hashes in C;
+    falls back to chunked streaming on older interpreters.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").digest()
+        h = hashlib.sha256()
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+        return h.digest()
+
+
+def _find_py_files(root: str) -> list:
+    """Paths of all .py files under root, one scandir per directory.
+
+    DirEntry type checks come from the directory read, so no per-entry
+    stat is needed. Symlinked directories are not descended, as with
+    Path.rglob; results are sorted by path components, as sorted(Path)
+    would, so the artifact hash is unchanged.
+    """
+    found = []
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    found.append(entry.path)
+    found.sort(key=lambda p: p.split(os.sep))
+    return found
+
+
+def hash_directory(dirpath: str, paths=None) -> str:
+    """SHA256 over the per-file SHA256 digests of all .py files, sorted.
+
+    Files are hashed on a thread pool (hashlib releases the GIL); digests
+    are folded in sorted path order.
+
+    Callers that already walked the tree can pass the sorted .py paths
+    under dirpath to skip a second walk.
+    """
+    if paths is None:
+        paths = _find_py_files(dirpath)
     h = hashlib.sha256()
-    for path in sorted(Path(dirpath).rglob("*.py")):
-        h.update(path.read_bytes())
+    if not paths:
+        return h.hexdigest()
+    workers = min(os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for digest in ex.map(_file_sha256, paths):
+            h.update(digest)
     return h.hexdigest()
 
 
+def scan_files(paths) -> list:
+    """AST-scan each file, in the given order.
+
+    Parsing is CPU-bound and holds the GIL, so larger artifacts are
+    scanned across a process pool; map() keeps results in input order.
+    """
+    paths = [str(p) for p in paths]
+    cpus = os.cpu_count() or 1
+    if len(paths) < PARALLEL_SCAN_MIN_FILES or cpus < 2:
+        return [scan_file(p) for p in paths]
+    # About four chunks per worker, and no more workers than chunks, so
+    # every forked process gets work.
+    chunksize = max(1, len(paths) // (cpus * 4))
+    workers = min(cpus, -(-len(paths) // chunksize))
+    with multiprocessing.Pool(processes=workers) as pool:
+        return pool.map(scan_file, paths, chunksize=chunksize)
+
+
 def run_i1(artifact_dir: str) -> dict:
     """Run I1 static scan on an artifact directory."""
     artifact_dir = str(artifact_dir)
@@ -46,18 +127,27 @@ def run_i1(artifact_dir: str) -> dict:
             "verdict": "REJECT",
         }
 
+    # One walk of the artifact feeds both the hash and the scan
+    py_paths = _find_py_files(artifact_dir)
+
     # Hash the artifact
-    artifact_hash = hash_directory(artifact_dir)
+    artifact_hash = hash_directory(artifact_dir, paths=py_paths)
 
     # Scan all Python files
-    results = scan_directory(artifact_dir)
+    results = scan_files(py_paths)
 
-    # Aggregate
-    total_critical = sum(r["summary"]["critical"] for r in results if r["status"] == "SCANNED")
-    total_high = sum(r["summary"]["high"] for r in results if r["status"] == "SCANNED")
-    total_medium = sum(r["summary"]["medium"] for r in results if r["status"] == "SCANNED")
-    total_low = sum(r["summary"]["low"] for r in results if r["status"] == "SCANNED")
-    parse_errors = sum(1 for r in results if r["status"] == "PARSE_ERROR")
+    # Aggregate (single pass over results)
+    total_critical = total_high = total_medium = total_low = parse_errors = 0
+    for r in results:
+        status = r["status"]
+        if status == "SCANNED":
+            summary = r["summary"]
+            total_critical += summary["critical"]
+            total_high += summary["high"]
+            total_medium += summary["medium"]
+            total_low += summary["low"]
+        elif status == "PARSE_ERROR":
+            parse_errors += 1
 
     # Verdict
     if total_critical > 0 or parse_errors > 0:
@@ -98,15 +188,48 @@ def run_i1(artifact_dir: str) -> dict:
     return record
 
 
-def log_result(record: dict):
-    """Append result to INTENT_LOG.jsonl."""
-    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+_LOG_FH = None
+
+
+def _intent_log():
+    """Long-lived unbuffered append handle for INTENT_LOG.jsonl.
+
+    Nothing is held in user space: each write() reaches the file at
+    once, and O_APPEND keeps a whole record together when several
+    scanners append concurrently.
+    """
+    global _LOG_FH
+    if _LOG_FH is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        _LOG_FH = open(INTENT_LOG, "ab", buffering=0)
+        atexit.register(_LOG_FH.close)
+    return _LOG_FH
 
+
+def _log_line(record: dict) -> bytes:
     # Write without details for the log (keep it compact)
     log_entry = {k: v for k, v in record.items() if k != "details"}
+    return json.dumps(log_entry).encode("utf-8") + b"\n"
+
+
+def log_result(record: dict, fsync: bool = False):
+    """Append result to INTENT_LOG.jsonl with one write; fsync=True also forces it to disk."""
+    log_results([record], fsync=fsync)
+
+
+def log_results(records, fsync: bool = False):
+    """Append several results to INTENT_LOG.jsonl in a single write.
 
-    with open(INTENT_LOG, "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    Opt-in batching for callers that already hold a batch of records;
+    nothing is buffered past this call.
+    """
+    fh = _intent_log()
+    # A raw write can be short; keep going until every byte is out.
+    view = memoryview(b"".join(_log_line(r) for r in records))
+    while view:
+        view = view[fh.write(view):]
+    if fsync:
+        os.fsync(fh.fileno())
 
 
 def main():
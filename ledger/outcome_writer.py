@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 
-CANONICAL_CLASSES = {
+CANONICAL_CLASSES = frozenset({
     "OK",
     "FORMAT_INVALID",
     "MANIFEST_INVALID",
@@ -32,33 +33,59 @@ CANONICAL_CLASSES = {
     "INTENT_FAIL_I4",
     "INTENT_FAIL_I5",
     "INTENT_FAIL_I6",
-}
+})
 
 
 # F4 FIX: Executioner verdicts -> canonical classes translation.
 # The executioner uses its own verdict strings (e.g. "KILLED_T0_SELFTEST").
 # This mapping translates them to the HB canonical class vocabulary.
-EXECUTIONER_VERDICT_MAP: Dict[str, List[str]] = {
-    "KILLED_INVALID_ZIP": ["FORMAT_INVALID"],
-    "KILLED_INVALID_SAIF": ["MANIFEST_INVALID"],
-    "KILLED_T0_SELFTEST": ["HARNESS_FAIL_T0"],
-    "KILLED_T1_SYNTAX": ["HARNESS_FAIL_T1"],
-    "KILLED_T2_DEGRADATION": ["HARNESS_FAIL_T2"],
-    "KILLED_T3_COMPACTION": ["HARNESS_FAIL_T3"],
-    "KILLED_T4_RESTART": ["HARNESS_FAIL_T4"],
-    "DUPLICATE_FAILURE": ["POLICY_VIOLATION"],
-    "SURVIVOR_PHASE_0": ["OK"],
+EXECUTIONER_VERDICT_MAP: Dict[str, Tuple[str, ...]] = {
+    "KILLED_INVALID_ZIP": ("FORMAT_INVALID",),
+    "KILLED_INVALID_SAIF": ("MANIFEST_INVALID",),
+    "KILLED_T0_SELFTEST": ("HARNESS_FAIL_T0",),
+    "KILLED_T1_SYNTAX": ("HARNESS_FAIL_T1",),
+    "KILLED_T2_DEGRADATION": ("HARNESS_FAIL_T2",),
+    "KILLED_T3_COMPACTION": ("HARNESS_FAIL_T3",),
+    "KILLED_T4_RESTART": ("HARNESS_FAIL_T4",),
+    "DUPLICATE_FAILURE": ("POLICY_VIOLATION",),
+    "SURVIVOR_PHASE_0": ("OK",),
 }
 
 
-def translate_executioner_verdict(verdict: str) -> List[str]:
+_UNKNOWN_VERDICT_CLASSES: Tuple[str, ...] = ("INTERNAL_ERROR",)
+
+
+def translate_executioner_verdict(verdict: str) -> Tuple[str, ...]:
     """
     Translate an executioner verdict string to canonical HB class(es).
 
-    Returns a list of canonical classes. Falls back to ["INTERNAL_ERROR"] for
-    unknown verdicts.
+    Returns a shared, immutable tuple of canonical classes. Falls back to
+    ("INTERNAL_ERROR",) for unknown verdicts.
+    """
+    return EXECUTIONER_VERDICT_MAP.get(verdict, _UNKNOWN_VERDICT_CLASSES)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes with a bare open/write/close, bypassing the io stack."""
+    # 0o666 as open() uses, so the caller's umask decides the final mode.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _dump_outcome(outcome: Dict[str, Any]) -> bytes:
+    """Serialize an outcome as indented, key-sorted JSON plus trailing newline.
+
+    Ledger bytes must not depend on what is installed, so this stays on
+    the stdlib encoder: orjson formats floats (1e16, 0.00001) and
+    non-ASCII text differently.
     """
-    return EXECUTIONER_VERDICT_MAP.get(verdict, ["INTERNAL_ERROR"])
+    # json.dumps escapes non-ASCII by default, so the ASCII codec suffices.
+    return json.dumps(outcome, indent=2, sort_keys=True).encode("ascii") + b"\n"
 
 
 def write_outcome(
@@ -67,7 +94,7 @@ def write_outcome(
     pubkey: str,
     stage: str,
     result: str,
-    classes: List[str],
+    classes: Sequence[str],
     fingerprint: str,
     details: Optional[Dict[str, Any]] = None,
     paths: Optional[Dict[str, str]] = None,
@@ -78,9 +105,9 @@ def write_outcome(
     """
 
     # ---- Enforce canonical class vocabulary ----
-    unknown = [c for c in classes if c not in CANONICAL_CLASSES]
+    unknown = set(classes) - CANONICAL_CLASSES
     if unknown:
-        raise ValueError(f"Unknown HB class(es): {unknown}")
+        raise ValueError(f"Unknown HB class(es): {sorted(unknown)}")
 
     # ---- Sanitize artifact_id against path traversal ----
     safe_id = artifact_id.replace("sha256:", "")
@@ -105,10 +132,10 @@ def write_outcome(
         outcome["paths"] = paths
 
     out_path = root / "outcome.json"
-    out_path.write_text(json.dumps(outcome, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _write_file(out_path, _dump_outcome(outcome))
 
     # Optional: public-facing fingerprint file
     fp_path = root / "fingerprint.txt"
-    fp_path.write_text(fingerprint.strip() + "\n", encoding="utf-8")
+    _write_file(fp_path, fingerprint.strip().encode("utf-8") + b"\n")
 
     return out_path
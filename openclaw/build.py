@@ -3,7 +3,12 @@
 OpenClaw Static Site Builder (v0.3)
 Reads ledger/HB_STATE.json and results/*/outcome.json.
 Writes openclaw_site/ with dashboard, results, genes, denylist, about + assets.
-Standard library only. No network. No untrusted code execution.
+Standard library only (orjson is used for parsing when installed).
+No network. No untrusted code execution.
+
+Unchanged inputs (state, outcomes, briefs, templates, this script) skip the
+rebuild as long as every output is still present; pass --force to rebuild
+regardless.
 
 v0.3 changes:
   - Counts active briefs for {{active_briefs}} template variable
@@ -11,26 +16,73 @@ v0.3 changes:
   - Better error messages for missing data
 """
 from __future__ import annotations
+import functools
+import hashlib
+import html
 import json
+import os
+import re
 import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 LEDGER_DIR = REPO_ROOT / "ledger"
 RESULTS_DIR = REPO_ROOT / "results"
 BRIEFS_DIR = REPO_ROOT / "briefs" / "active"
 TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 OUT_DIR = REPO_ROOT / "openclaw_site"
+# Build fingerprint lives outside OUT_DIR so it is never published.
+CACHE_FILE = REPO_ROOT / ".cache" / "openclaw_build.json"
 ASSETS = ["style.css", "theme.js"]
+EXTRA_PAGES = ["briefs.html", "pipeline.html", "economics.html", "governance.html"]
+SITE_PAGES = ["index.html", "results.html", "genes.html", "denylist.html", "about.html"] + EXTRA_PAGES
+VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+RESULT_KEYS = ("SURVIVED", "CULLED", "BLACKLISTED", "QUEUED", "QUARANTINED", "REJECTED")
+
+# Stage/result/class labels come from a small fixed vocabulary, so their
+# escaped forms are memoized; free-form fields go through html.escape.
+_escape_label = functools.lru_cache(maxsize=256)(html.escape)
+
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+# Results are written by untrusted pipelines; never follow a symlinked file.
+_NOFOLLOW_READ_FLAGS = _READ_FLAGS | getattr(os, "O_NOFOLLOW", 0)
+
 
+def read_json(path: Path, nofollow: bool = False) -> Any:
+    # Both parsers take UTF-8 bytes directly, skipping a str decode pass.
+    fd = os.open(path, _NOFOLLOW_READ_FLAGS if nofollow else _READ_FLAGS)
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size or 65536)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return _loads(b"".join(chunks))
 
-def read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+
+# Output directories already created this run; skips a mkdir per page.
+_made_dirs: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    if path not in _made_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _made_dirs.add(path)
 
 
 def write_text(path: Path, s: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(path.parent)
     path.write_text(s, encoding="utf-8", newline="\n")
 
 
@@ -42,82 +94,145 @@ def load_state() -> Dict[str, Any]:
     return read_json(state_path)
 
 
+def _load_outcome(artifact_dir: str) -> Dict[str, Any] | None:
+    # A missing outcome.json surfaces as FileNotFoundError; no exists() stat.
+    try:
+        return read_json(Path(artifact_dir, "outcome.json"), nofollow=True)
+    except Exception:
+        return None
+
+
 def load_outcomes() -> List[Dict[str, Any]]:
-    outcomes: List[Dict[str, Any]] = []
-    if not RESULTS_DIR.exists():
-        return outcomes
-    for artifact_dir in sorted(RESULTS_DIR.iterdir()):
-        if not artifact_dir.is_dir():
-            continue
-        out_path = artifact_dir / "outcome.json"
-        if not out_path.exists():
-            continue
-        try:
-            outcomes.append(read_json(out_path))
-        except Exception:
-            continue
-    return outcomes
+    """Load results/*/outcome.json in artifact-directory order.
+
+    Reads are I/O-bound, so they are fanned out over a thread pool;
+    map() keeps results in the sorted directory order.
+    """
+    if not os.path.isdir(RESULTS_DIR):
+        return []
+    with os.scandir(RESULTS_DIR) as it:
+        entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    if not entries:
+        return []
+    # Sort on the bare entry name: a short string compare, no Path objects.
+    entries.sort(key=attrgetter("name"))
+    dirs = [e.path for e in entries]
+    workers = min(32, (os.cpu_count() or 1) * 4, len(dirs))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return [o for o in ex.map(_load_outcome, dirs) if o is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def _active_brief_entries() -> tuple[os.DirEntry, ...]:
+    """Markdown briefs in briefs/active/, sorted by name; scanned once per main() run."""
+    if not os.path.isdir(BRIEFS_DIR):
+        return ()
+    with os.scandir(BRIEFS_DIR) as it:
+        entries = [e for e in it if e.name.endswith(".md") and e.is_file(follow_symlinks=False)]
+    entries.sort(key=attrgetter("name"))
+    return tuple(entries)
 
 
 def count_active_briefs() -> int:
     """Count briefs in briefs/active/ directory."""
-    if not BRIEFS_DIR.exists():
-        return 0
-    return sum(1 for f in BRIEFS_DIR.iterdir() if f.is_file() and f.suffix == ".md")
+    return len(_active_brief_entries())
 
 
-def render_template(name: str, context: Dict[str, Any]) -> str | None:
+@functools.lru_cache(maxsize=32)
+def _load_template(name: str) -> tuple[str, ...] | None:
+    """Read a template once and pre-split it on its placeholders.
+
+    Even indices are literal text, odd indices are placeholder names.
+    """
     tpl_path = TEMPLATES_DIR / name
     if not tpl_path.exists():
+        return None
+    return tuple(VAR_RE.split(tpl_path.read_text(encoding="utf-8")))
+
+
+def render_template(name: str, context: Dict[str, Any]) -> str | None:
+    segments = _load_template(name)
+    if segments is None:
         print(f"  Warning: Template {name} not found, skipping.")
         return None
-    tpl = tpl_path.read_text(encoding="utf-8")
-    for k, v in context.items():
-        tpl = tpl.replace("{{" + k + "}}", str(v))
-    return tpl
+    # Placeholders without a value are left as-is.
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        key = parts[i]
+        parts[i] = str(context[key]) if key in context else "{{" + key + "}}"
+    return "".join(parts)
 
 
 def copy_assets() -> None:
+    # Contents only: the site needs no preserved mode or mtime, and copyfile
+    # already uses the kernel's sendfile path on Linux.
     for asset in ASSETS:
-        src = TEMPLATES_DIR / asset
-        if src.exists():
-            shutil.copy2(src, OUT_DIR / asset)
+        try:
+            shutil.copyfile(TEMPLATES_DIR / asset, OUT_DIR / asset)
+        except FileNotFoundError:
+            pass
 
 
-def build_index(state, outcomes):
-    counts = {"SURVIVED": 0, "CULLED": 0, "BLACKLISTED": 0,
-              "QUEUED": 0, "QUARANTINED": 0, "REJECTED": 0}
-    for o in outcomes:
-        r = o.get("result", "UNKNOWN")
-        if r in counts:
-            counts[r] += 1
+def count_results(outcomes) -> Dict[str, int]:
+    """Tally outcomes by result in a single pass, zero-filling every known result."""
+    tally = Counter(o.get("result", "UNKNOWN") for o in outcomes)
+    return {k: tally[k] for k in RESULT_KEYS}
+
+
+def build_index(state, counts):
     active_briefs = count_active_briefs()
     context = {
         "project": state.get("project", "House Bernard"),
-        "survived": counts["SURVIVED"], "culled": counts["CULLED"],
-        "blacklisted": counts["BLACKLISTED"], "queued": counts["QUEUED"],
-        "quarantined": counts["QUARANTINED"], "rejected": counts["REJECTED"],
         "active_briefs": active_briefs,
     }
+    context.update((k.lower(), n) for k, n in counts.items())
     html = render_template("index.html", context)
     if html:
         write_text(OUT_DIR / "index.html", html)
 
 
-def build_results(outcomes):
-    rows = []
+def _result_rows(outcomes):
+    """Yield one escaped <tr> per outcome, newline-separated."""
+    # Outcomes are plain dicts from JSON; dict.get skips a bound-method
+    # lookup for each of the five fields per row.
+    esc = html.escape
+    esc_label = _escape_label
+    get = dict.get
+    sep = ""
     for o in outcomes:
-        rows.append(
-            f"<tr><td>{o.get('artifact_id', '')}</td>"
-            f"<td>{o.get('stage', '')}</td>"
-            f"<td>{o.get('result', '')}</td>"
-            f"<td>{','.join(o.get('classes', []))}</td>"
-            f"<td>{o.get('fingerprint', '')}</td></tr>"
+        yield (
+            f"{sep}<tr><td>{esc(str(get(o, 'artifact_id', '')))}</td>"
+            f"<td>{esc_label(str(get(o, 'stage', '')))}</td>"
+            f"<td>{esc_label(str(get(o, 'result', '')))}</td>"
+            f"<td>{esc_label(','.join(get(o, 'classes', [])))}</td>"
+            f"<td>{esc(str(get(o, 'fingerprint', '')))}</td></tr>"
         )
-    context = {"rows": "\n".join(rows) if rows else "<tr><td colspan='5'>No results yet.</td></tr>"}
-    html = render_template("results.html", context)
-    if html:
-        write_text(OUT_DIR / "results.html", html)
+        sep = "\n"
+
+
+def build_results(outcomes):
+    if not outcomes:
+        context = {"rows": "<tr><td colspan='5'>No results yet.</td></tr>"}
+        page = render_template("results.html", context)
+        if page:
+            write_text(OUT_DIR / "results.html", page)
+        return
+
+    segments = _load_template("results.html")
+    if segments is None:
+        print("  Warning: Template results.html not found, skipping.")
+        return
+    # Rows are streamed straight into the file at the {{rows}} marker
+    # rather than joined into one string first.
+    ensure_dir(OUT_DIR)
+    with open(OUT_DIR / "results.html", "w", encoding="utf-8", newline="\n") as f:
+        for i, seg in enumerate(segments):
+            if i % 2 == 0:
+                f.write(seg)
+            elif seg == "rows":
+                f.writelines(_result_rows(outcomes))
+            else:
+                f.write("{{" + seg + "}}")
 
 
 def build_genes():
@@ -140,29 +255,90 @@ def build_about():
         write_text(OUT_DIR / "about.html", html)
 
 
+def _build_page(page: str) -> None:
+    html = render_template(page, {})
+    if html:
+        write_text(OUT_DIR / page, html)
+
+
 def build_pages():
-    """Build additional pages (briefs, pipeline, economics, governance) if templates exist."""
-    for page in ["briefs.html", "pipeline.html", "economics.html", "governance.html"]:
-        html = render_template(page, {})
-        if html:
-            write_text(OUT_DIR / page, html)
+    """Build additional pages (briefs, pipeline, economics, governance) if templates exist.
+
+    The pages are independent, so their template reads and writes overlap
+    on a small thread pool.
+    """
+    with ThreadPoolExecutor(max_workers=len(EXTRA_PAGES)) as ex:
+        list(ex.map(_build_page, EXTRA_PAGES))
+
+
+def _input_fingerprint() -> str:
+    """blake2b over the path, mtime and size of every input the site reads."""
+    h = hashlib.blake2b(digest_size=16)
+
+    def add(path) -> None:
+        try:
+            st = os.stat(path)
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            h.update(f"{path}\0-\n".encode())
+
+    add(__file__)
+    add(LEDGER_DIR / "HB_STATE.json")
+    for root in (RESULTS_DIR, BRIEFS_DIR, TEMPLATES_DIR):
+        try:
+            with os.scandir(root) as it:
+                names = sorted(e.name for e in it)
+        except OSError:
+            names = []
+        for name in names:
+            add(os.path.join(root, name))
+            if root is RESULTS_DIR:
+                add(os.path.join(root, name, "outcome.json"))
+    return h.hexdigest()
+
+
+def _outputs_present() -> bool:
+    """Every page and asset with a template has been written to OUT_DIR."""
+    return all(
+        (OUT_DIR / name).exists()
+        for name in SITE_PAGES + ASSETS
+        if (TEMPLATES_DIR / name).exists()
+    )
+
+
+def _cached_fingerprint() -> str | None:
+    try:
+        return read_json(CACHE_FILE).get("fp")
+    except Exception:
+        return None
 
 
 def main() -> int:
     print("OpenClaw Site Builder v0.3")
+    # The memoized scans and the made-dirs set live for the process;
+    # reset them so a second main() in the same process starts fresh.
+    _active_brief_entries.cache_clear()
+    _load_template.cache_clear()
+    _made_dirs.clear()
+    fingerprint = _input_fingerprint()
+    if "--force" not in sys.argv[1:] and _cached_fingerprint() == fingerprint and _outputs_present():
+        print(f"  No input changes; site at {OUT_DIR} is up to date.")
+        return 0
+
     state = load_state()
     outcomes = load_outcomes()
     active_briefs = count_active_briefs()
     print(f"  State: loaded | Outcomes: {len(outcomes)} | Active briefs: {active_briefs}")
 
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_dir(OUT_DIR)
     copy_assets()
-    build_index(state, outcomes)
+    build_index(state, count_results(outcomes))
     build_results(outcomes)
     build_genes()
     build_denylist()
     build_about()
     build_pages()
+    write_text(CACHE_FILE, json.dumps({"fp": fingerprint}))
     print(f"  Site built at: {OUT_DIR}")
     return 0
 
@@ -28,51 +28,125 @@ Cron (every 30 min):
 
 import json
 import os
-import shutil
+import signal
 import subprocess
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+    from orjson import loads as _loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 
 REQUIRED_MODELS: list[str] = ["llama3.2:3b", "mistral:7b", "llama3:8b"]
 TREASURY_STATE: str = os.path.expanduser("~/House-Bernard/treasury/treasury_state.json")
 WORKSPACE_ROOT: str = os.path.expanduser("~/.openclaw/agents/achillesrun/workspace")
 PAUSE_FILE: str = os.path.expanduser("~/House-Bernard/treasury/PAUSE")
 DISK_WARN_PERCENT: int = 90
+OLLAMA_TIMEOUT: int = 10
 
 WORKSPACE_DIRS: list[str] = ["commons", "yard", "workshop", "sanctum"]
 
 
+_ollama_cache: dict[str, Any] = {}
+
+
+def _model_name(line: str) -> str | None:
+    """Lower-cased model name from the first column of an `ollama list` row.
+
+    Exact names avoid substring false positives such as llama3:8b
+    matching inside llama3:8b-instruct.
+    """
+    fields = line.split(maxsplit=1)
+    return fields[0].lower() if fields else None
+
+
+def _read_ollama_list() -> tuple[int, set[str]]:
+    """Stream `ollama list`, stopping as soon as every required model is seen.
+
+    Returns (exit code, required models found). An early stop counts as a
+    clean exit. A watchdog timer kills a hung process after OLLAMA_TIMEOUT.
+    """
+    wanted = {m.lower() for m in REQUIRED_MODELS}
+    found: set[str] = set()
+    early = False
+    with subprocess.Popen(
+        ["ollama", "list"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        start_new_session=True,
+    ) as proc:
+        expired = threading.Event()
+
+        def expire() -> None:
+            expired.set()
+            # Kill the whole group so no child keeps the stdout pipe open.
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        timer = threading.Timer(OLLAMA_TIMEOUT, expire)
+        timer.start()
+        try:
+            next(proc.stdout, None)  # skip the NAME/ID/SIZE header
+            for line in proc.stdout:
+                name = _model_name(line)
+                if name in wanted:
+                    found.add(name)
+                    if found == wanted:
+                        early = True
+                        proc.terminate()
+                        break
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+    if expired.is_set() and not early:
+        raise subprocess.TimeoutExpired(proc.args, OLLAMA_TIMEOUT)
+    return (0 if early else returncode), found
+
+
+def _ollama_list() -> tuple[int, set[str]]:
+    """Run `ollama list` once per process; both Ollama checks share it.
+
+    A failure (missing binary, timeout) is cached too and re-raised to
+    each caller, so a hung Ollama costs one timeout, not two.
+    """
+    if not _ollama_cache:
+        try:
+            _ollama_cache["result"] = _read_ollama_list()
+        except Exception as e:
+            _ollama_cache["error"] = e
+    if "error" in _ollama_cache:
+        raise _ollama_cache["error"]
+    return _ollama_cache["result"]
+
+
 def check_ollama_running() -> dict[str, Any]:
     """Check if Ollama service is responsive."""
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
+        returncode, _ = _ollama_list()
+        if returncode == 0:
             return {"status": "ok", "detail": "ollama responsive"}
-        return {"status": "alert", "detail": f"ollama exit code {result.returncode}"}
+        return {"status": "alert", "detail": f"ollama exit code {returncode}"}
     except FileNotFoundError:
         return {"status": "critical", "detail": "ollama not installed"}
     except subprocess.TimeoutExpired:
-        return {"status": "alert", "detail": "ollama timeout (10s)"}
+        return {"status": "alert", "detail": f"ollama timeout ({OLLAMA_TIMEOUT}s)"}
 
 
 def check_models_available() -> dict[str, Any]:
     """Verify all required models are pulled."""
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode != 0:
+        returncode, available = _ollama_list()
+        if returncode != 0:
             return {"status": "alert", "detail": "cannot list models"}
 
-        available = result.stdout.lower()
-        missing = [m for m in REQUIRED_MODELS if m not in available]
+        missing = [m for m in REQUIRED_MODELS if m.lower() not in available]
         if not missing:
             return {"status": "ok", "detail": f"all {len(REQUIRED_MODELS)} models present"}
         return {"status": "alert", "detail": f"missing models: {missing}"}
@@ -85,8 +159,8 @@ def check_treasury_state() -> dict[str, Any]:
     if not os.path.exists(TREASURY_STATE):
         return {"status": "warn", "detail": "treasury_state.json not found"}
     try:
-        with open(TREASURY_STATE, "r") as f:
-            data = json.load(f)
+        with open(TREASURY_STATE, "rb") as f:
+            data = _loads(f.read())
         if not isinstance(data, dict):
             return {"status": "alert", "detail": "treasury_state.json is not a dict"}
         return {"status": "ok", "detail": f"treasury state valid ({len(data)} keys)"}
@@ -96,11 +170,13 @@ def check_treasury_state() -> dict[str, Any]:
 
 def check_workspace_integrity() -> dict[str, Any]:
     """Verify workspace directory structure exists."""
-    missing = []
-    for d in WORKSPACE_DIRS:
-        path = os.path.join(WORKSPACE_ROOT, d)
-        if not os.path.isdir(path):
-            missing.append(d)
+    # One directory listing instead of a stat per expected dir.
+    try:
+        with os.scandir(WORKSPACE_ROOT) as it:
+            present = {e.name for e in it if e.is_dir()}
+    except OSError:
+        present = set()
+    missing = [d for d in WORKSPACE_DIRS if d not in present]
     if not missing:
         return {"status": "ok", "detail": f"all {len(WORKSPACE_DIRS)} workspace dirs intact"}
     return {"status": "alert", "detail": f"missing workspace dirs: {missing}"}
@@ -116,9 +192,13 @@ def check_pause_file() -> dict[str, Any]:
 def check_disk_usage() -> dict[str, Any]:
     """Check disk usage on the root partition."""
     try:
-        usage = shutil.disk_usage("/")
-        percent_used = int((usage.used / usage.total) * 100)
-        free_gb = round(usage.free / (1024 ** 3), 1)
+        # Same figures as shutil.disk_usage, straight from statvfs.
+        st = os.statvfs("/")
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        percent_used = int((used / total) * 100)
+        free_gb = round(free / (1024 ** 3), 1)
         if percent_used >= DISK_WARN_PERCENT:
             return {"status": "warn", "detail": f"disk {percent_used}% used ({free_gb}GB free)"}
         return {"status": "ok", "detail": f"disk {percent_used}% used ({free_gb}GB free)"}
@@ -161,10 +241,14 @@ def main() -> None:
     quiet = "--quiet" in sys.argv
     report = run_checks()
 
+    # Quiet mode never formats the report.
     if quiet:
         sys.exit(0 if report["overall"] == "healthy" else 1)
 
-    print(json.dumps(report, indent=2))
+    if orjson is not None:
+        print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    else:
+        print(json.dumps(report, indent=2))
     if report["overall"] != "healthy":
         sys.exit(1)
 
@@ -39,9 +39,15 @@ import sys
 import os
 import shutil
 import tempfile
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 # Shared utilities
 import sys as _sys
 _repo_root = str(Path(__file__).resolve().parents[1])
@@ -121,12 +127,18 @@ def append_log(log_path, entry):
 
 
 def read_log(log_path, n=20):
-    """Read last n entries from ops log."""
-    log_path = Path(log_path)
-    if not log_path.exists():
+    """Read last n entries from ops log.
+
+    The log is append-only and grows every month, so it is streamed
+    through a bounded deque instead of being read whole.
+    """
+    try:
+        # Raw UTF-8 lines; both parsers take bytes without a decode pass.
+        with open(log_path, "rb") as f:
+            tail = deque((line for line in f if line.strip()), maxlen=n)
+    except FileNotFoundError:
         return []
-    lines = log_path.read_text(encoding="utf-8").strip().split("\n")
-    return [json.loads(line) for line in lines[-n:] if line.strip()]
+    return [_loads(line) for line in tail]
 
 
 # ---------------------------------------------------------------------------
@@ -4,8 +4,11 @@ House Bernard — Master Test Runner
 Runs all test suites and reports results.
 
 Usage:
-    python3 run_tests.py          # Run all suites
+    python3 run_tests.py          # Run all suites (in parallel)
     python3 run_tests.py -v       # Verbose output
+    python3 run_tests.py --serial # Run suites one at a time
+    python3 run_tests.py -j 2     # At most 2 suites at once (default: CPU count)
+    python3 run_tests.py --fail-fast  # Skip suites not yet started after a failure
 
 Suites (public repo):
     1. Guild System          — guild/test_guild_system.py      (unittest)
@@ -14,9 +17,11 @@ Suites (public repo):
     4. Backend Integration   — treasury/test_backend.py        (custom)
 """
 
+import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent
@@ -62,24 +67,43 @@ def run_suite(suite, verbose=False):
         cmd = [sys.executable, str(path)]
 
     try:
-        result = subprocess.run(
+        # stderr is merged into stdout so tracebacks stay next to the
+        # output that preceded them instead of being appended at the end.
+        with subprocess.Popen(
             cmd,
             cwd=cwd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=120,
-        )
-        output = result.stdout + result.stderr
-        success = result.returncode == 0
-        return suite["name"], success, output
-    except subprocess.TimeoutExpired:
-        return suite["name"], False, "TIMEOUT (120s)"
+        ) as proc:
+            try:
+                output, _ = proc.communicate(timeout=120)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                return suite["name"], False, "TIMEOUT (120s)"
+        return suite["name"], proc.returncode == 0, output
     except Exception as e:
         return suite["name"], False, str(e)
 
 
+def parse_jobs(argv):
+    """Worker count from -j N / --jobs N; defaults to the CPU count."""
+    for flag in ("-j", "--jobs"):
+        if flag in argv:
+            i = argv.index(flag)
+            try:
+                return max(1, int(argv[i + 1]))
+            except (IndexError, ValueError):
+                print(f"  {flag} needs a number; using the CPU count")
+    return os.cpu_count() or 1
+
+
 def main():
     verbose = "-v" in sys.argv or "--verbose" in sys.argv
+    jobs = min(len(SUITES), parse_jobs(sys.argv))
+    serial = "--serial" in sys.argv or jobs == 1
+    fail_fast = "--fail-fast" in sys.argv
 
     print("=" * 60)
     print("  HOUSE BERNARD — MASTER TEST RUNNER")
@@ -89,14 +113,55 @@ def main():
     results = []
     total_start = time.time()
 
+    if serial:
+        for suite in SUITES:
+            print(f"  [{suite['name']}]", end=" ", flush=True)
+            start = time.time()
+            name, success, output = run_suite(suite, verbose)
+            elapsed = time.time() - start
+            status = "PASS" if success else "FAIL"
+            print(f"... {status} ({elapsed:.1f}s)")
+            results.append((name, success, output, elapsed))
+            if fail_fast and not success:
+                break
+    else:
+        # Suites are independent subprocesses with their own cwd, so they
+        # run concurrently; lines print as suites finish, the summary
+        # below keeps SUITES order.
+        def timed(suite):
+            start = time.time()
+            name, success, output = run_suite(suite, verbose)
+            return name, success, output, time.time() - start
+
+        by_name = {}
+
+        def record(fut):
+            name, success, output, elapsed = fut.result()
+            status = "PASS" if success else "FAIL"
+            print(f"  [{name}] ... {status} ({elapsed:.1f}s)", flush=True)
+            by_name[name] = (name, success, output, elapsed)
+            return success
+
+        with ThreadPoolExecutor(max_workers=jobs) as ex:
+            futures = [ex.submit(timed, suite) for suite in SUITES]
+            recorded = set()
+            for fut in as_completed(futures):
+                recorded.add(fut)
+                if not record(fut) and fail_fast:
+                    # Queued suites are dropped; ones already running finish
+                    # and are still reported.
+                    for other in futures:
+                        other.cancel()
+                    for other in futures:
+                        if other not in recorded and not other.cancelled():
+                            record(other)
+                    break
+        results = [by_name[suite["name"]] for suite in SUITES if suite["name"] in by_name]
+
+    ran = {name for name, _, _, _ in results}
     for suite in SUITES:
-        print(f"  [{suite['name']}]", end=" ", flush=True)
-        start = time.time()
-        name, success, output = run_suite(suite, verbose)
-        elapsed = time.time() - start
-        status = "PASS" if success else "FAIL"
-        print(f"... {status} ({elapsed:.1f}s)")
-        results.append((name, success, output, elapsed))
+        if suite["name"] not in ran:
+            print(f"  [{suite['name']}] ... SKIPPED (--fail-fast)")
 
     total_elapsed = time.time() - total_start
 
@@ -7,6 +7,11 @@ repos are identical.
 Usage:
     python3 scripts/check_sync.py /path/to/public /path/to/classified
     python3 scripts/check_sync.py                 # Auto-detect sibling repos
+    python3 scripts/check_sync.py --no-cache ...  # Re-read every document
+    python3 scripts/check_sync.py --diff ...      # Show what differs in DIFF docs
+
+Verdicts are cached in .check_sync_cache.json, keyed on the path, mtime
+and size of both copies, so unchanged documents are not re-read.
 
 Shared documents (must be identical):
     CONSTITUTION.md, COVENANT.md, COUNCIL.md, CITIZENSHIP.md,
@@ -23,11 +28,17 @@ Intentionally different (OPSEC):
     README.md           — different content per repo
 """
 
-import hashlib
+import difflib
+import filecmp
+import json
+import os
 import sys
 from pathlib import Path
 
 
+CACHE_FILE = Path(__file__).resolve().parent.parent / ".check_sync_cache.json"
+DIFF_MAX_LINES = 40
+
 # Documents that MUST be identical across repos
 SHARED_DOCS = [
     "CONSTITUTION.md",
@@ -60,11 +71,123 @@ OPSEC_DIFFERENT = [
 ]
 
 
-def file_hash(path):
-    """SHA-256 hash of file contents."""
-    if not path.exists():
+def _stat(path):
+    try:
+        return path.stat()
+    except FileNotFoundError:
         return None
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _prefetch(paths):
+    """Queue kernel readahead for files about to be read (Linux/BSD only).
+
+    On a cold cache this lets the reads for every document overlap
+    instead of each compare waiting on its own disk I/O.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def compare_docs(public, classified, docs, cache=None, seen=None):
+    """Byte-compare each doc across repos; returns {doc: (same, in_public, in_classified)}.
+
+    same is None if either copy is missing.
+
+    Hardlinked copies and copies of differing size are settled from stat.
+    A verdict found in cache under the same (resolved path, mtime, size) pair is
+    reused without reading either file. The rest go to filecmp.cmpfiles
+    in one batch; it rejects differing sizes before reading and otherwise
+    stops at the first differing block. Every verdict is recorded in seen.
+    """
+    # filecmp memoizes on the paths it is given, so compare absolute ones.
+    public, classified = Path(public).resolve(), Path(classified).resolve()
+    results = {}
+    keys = {}
+    for doc in docs:
+        pa, pb = public / doc, classified / doc
+        sa, sb = _stat(pa), _stat(pb)
+        if sa is None or sb is None:
+            results[doc] = (None, sa is not None, sb is not None)
+            continue
+        # Same inode proves identity and a size mismatch proves difference,
+        # both without opening either file.
+        if (sa.st_dev, sa.st_ino) == (sb.st_dev, sb.st_ino):
+            results[doc] = (True, True, True)
+            continue
+        if sa.st_size != sb.st_size:
+            results[doc] = (False, True, True)
+            continue
+        # Absolute, symlink-free paths: the same relative arguments run
+        # from another directory must not share entries.
+        key = f"{pa.resolve()}|{sa.st_mtime_ns}|{sa.st_size}|{pb.resolve()}|{sb.st_mtime_ns}|{sb.st_size}"
+        same = cache.get(key) if cache else None
+        if same is None:
+            keys[doc] = key
+        else:
+            results[doc] = (same, True, True)
+            if seen is not None:
+                seen[key] = same
+
+    if keys:
+        _prefetch([root / doc for doc in keys for root in (public, classified)])
+        match, mismatch, errors = filecmp.cmpfiles(public, classified, list(keys), shallow=False)
+        for doc in match:
+            results[doc] = (True, True, True)
+        for doc in mismatch:
+            results[doc] = (False, True, True)
+        if seen is not None:
+            seen.update((keys[doc], results[doc][0]) for doc in match + mismatch)
+        # Unreadable or vanished mid-run: report as differing, never cache.
+        for doc in errors:
+            results[doc] = (False, True, True)
+    return results
+
+
+def print_diff(a, b, label):
+    """Print a capped unified diff of two text files, reading each once."""
+    a_lines = a.read_text(encoding="utf-8", errors="replace").splitlines()
+    b_lines = b.read_text(encoding="utf-8", errors="replace").splitlines()
+    diff = difflib.unified_diff(
+        a_lines, b_lines, f"public/{label}", f"classified/{label}", lineterm=""
+    )
+    shown = 0
+    for line in diff:
+        if shown == DIFF_MAX_LINES:
+            print("        ... (diff truncated)")
+            break
+        print(f"        {line}")
+        shown += 1
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache):
+    """Write the cache atomically; a read-only checkout just skips it."""
+    tmp = CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, sort_keys=True)
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
 
 
 def find_repos():
@@ -99,7 +222,7 @@ def find_repos():
     return public, classified
 
 
-def check_sync(public_path, classified_path):
+def check_sync(public_path, classified_path, use_cache=True, show_diff=False):
     """Compare shared documents between repos."""
     public = Path(public_path)
     classified = Path(classified_path)
@@ -121,47 +244,54 @@ def check_sync(public_path, classified_path):
     in_sync = 0
     out_of_sync = 0
     missing = 0
+    # Only verdicts for this run's pairs are saved, so stale keys drop out.
+    cache = load_cache() if use_cache else None
+    seen = {}
 
     # Check shared docs
     print("  SHARED DOCUMENTS (must be identical):")
     print("-" * 50)
+    shared = compare_docs(public, classified, SHARED_DOCS, cache, seen)
     for doc in SHARED_DOCS:
-        pub_hash = file_hash(public / doc)
-        cls_hash = file_hash(classified / doc)
+        same, in_pub, in_cls = shared[doc]
 
-        if pub_hash is None and cls_hash is None:
+        if not in_pub and not in_cls:
             print(f"    SKIP  {doc} (not in either repo)")
             continue
-        elif pub_hash is None:
+        elif not in_pub:
             print(f"    MISS  {doc} (missing from public)")
             missing += 1
-        elif cls_hash is None:
+        elif not in_cls:
             print(f"    MISS  {doc} (missing from classified)")
             missing += 1
-        elif pub_hash == cls_hash:
+        elif same:
             print(f"    OK    {doc}")
             in_sync += 1
         else:
             print(f"    DIFF  {doc} *** OUT OF SYNC ***")
+            if show_diff:
+                print_diff(public / doc, classified / doc, doc)
             out_of_sync += 1
 
     # Check OPSEC docs
     print()
     print("  OPSEC DOCUMENTS (intentionally different):")
     print("-" * 50)
+    opsec = compare_docs(public, classified, OPSEC_DIFFERENT, cache, seen)
     for doc in OPSEC_DIFFERENT:
-        pub_hash = file_hash(public / doc)
-        cls_hash = file_hash(classified / doc)
-
-        if pub_hash is None or cls_hash is None:
-            status = "MISS" if (pub_hash is None or cls_hash is None) else "OK"
-            where = "public" if pub_hash is None else "classified"
-            print(f"    {status}  {doc} (missing from {where})")
-        elif pub_hash == cls_hash:
+        same, in_pub, in_cls = opsec[doc]
+
+        if same is None:
+            where = "public" if not in_pub else "classified"
+            print(f"    MISS  {doc} (missing from {where})")
+        elif same:
             print(f"    WARN  {doc} (identical — expected different)")
         else:
             print(f"    OK    {doc} (different as expected)")
 
+    if use_cache:
+        save_cache(seen)
+
     # Summary
     print()
     print("=" * 60)
@@ -179,9 +309,12 @@ def check_sync(public_path, classified_path):
 
 
 def main():
-    if len(sys.argv) >= 3:
-        public = sys.argv[1]
-        classified = sys.argv[2]
+    use_cache = "--no-cache" not in sys.argv
+    show_diff = "--diff" in sys.argv
+    args = [a for a in sys.argv[1:] if a not in ("--no-cache", "--diff")]
+    if len(args) >= 2:
+        public = args[0]
+        classified = args[1]
     else:
         public, classified = find_repos()
         if public is None or classified is None:
@@ -195,7 +328,7 @@ def main():
                 print("  Classified repo not found as sibling directory.")
             sys.exit(1)
 
-    success = check_sync(public, classified)
+    success = check_sync(public, classified, use_cache, show_diff)
     sys.exit(0 if success else 1)
 
 
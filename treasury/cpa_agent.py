@@ -36,7 +36,6 @@ Usage:
 """
 
 import json
-from datetime import datetime, timezone
 from pathlib import Path
 
 # Shared utilities
@@ -100,9 +99,7 @@ class CPAAgent:
         amount_tokens = receipt.get("amount", 0)
         usd_per_token = receipt.get("usd_value_per_token", 0)
         usd_total = receipt.get("usd_total", 0)
-        year = datetime.fromisoformat(
-            receipt["timestamp"].replace("Z", "+00:00")
-        ).year
+        year = _parse_dt(receipt["timestamp"]).year
 
         # Record the payment
         payment_record = {
@@ -172,9 +169,7 @@ class CPAAgent:
             "description": description,
             "amount_usd": round(amount_usd, 2),
             "receipt_ref": receipt_ref,
-            "tax_year": datetime.fromisoformat(
-                (date or _format_dt(_now())).replace("Z", "+00:00")
-            ).year,
+            "tax_year": _parse_dt(date or _format_dt(_now())).year,
         }
         self.ledger["expenses"].append(expense)
         self._save_ledger()
@@ -230,11 +225,15 @@ class CPAAgent:
         """
         year_key = str(year)
 
-        # Income summary
-        income_payments = [
-            p for p in self.ledger["payments"]
-            if p["tax_year"] == year
-        ]
+        # Income summary; tokens are bucketed per contributor in the same
+        # pass so the contributor summary below needs no rescan per contributor.
+        income_payments = []
+        tokens_by_contributor = {}
+        for p in self.ledger["payments"]:
+            if p["tax_year"] == year:
+                income_payments.append(p)
+                cid = p["contributor_id"]
+                tokens_by_contributor[cid] = tokens_by_contributor.get(cid, 0) + p["amount_tokens"]
         total_tokens_disbursed = sum(p["amount_tokens"] for p in income_payments)
         total_usd_disbursed = sum(p.get("usd_total", 0) or 0 for p in income_payments)
 
@@ -295,10 +294,7 @@ class CPAAgent:
             "contributor_summary": {
                 cid: {
                     "total_usd": info["yearly_usd"].get(year_key, 0),
-                    "total_tokens": sum(
-                        p["amount_tokens"] for p in income_payments
-                        if p["contributor_id"] == cid
-                    ),
+                    "total_tokens": tokens_by_contributor.get(cid, 0),
                 }
                 for cid, info in self.ledger["contributors"].items()
                 if info["yearly_usd"].get(year_key, 0) > 0
@@ -316,17 +312,13 @@ class CPAAgent:
         quarter_payments = [
             p for p in self.ledger["payments"]
             if p["tax_year"] == year
-            and month_start <= datetime.fromisoformat(
-                p["timestamp"].replace("Z", "+00:00")
-            ).month <= month_end
+            and month_start <= _parse_dt(p["timestamp"]).month <= month_end
         ]
 
         quarter_expenses = [
             e for e in self.ledger["expenses"]
             if e["tax_year"] == year
-            and month_start <= datetime.fromisoformat(
-                e["date"].replace("Z", "+00:00")
-            ).month <= month_end
+            and month_start <= _parse_dt(e["date"]).month <= month_end
         ]
 
         return {